@@ -53,6 +53,7 @@ class TestCaseInsensitiveDict:
         assert d.get('C') == 2
         assert d.get('d') is None
         assert d.get('D', 1) == 1
+        assert d.get(1, 'x') == 'x'
         assert d['c'] == 2
         assert d['C'] == 2
 
@@ -63,6 +64,8 @@ class TestCaseInsensitiveDict:
         d['C'] = 2
         assert dict(d.items()) == {'c': 2}
         assert len(d) == 1
+        assert ('C', 2) in d.items()
+        assert ('C', 3) not in d.items()
 
     def test_del_and_contains(self, d):
         d['c'] = 2
@@ -74,6 +77,7 @@ class TestCaseInsensitiveDict:
     def test_fromkeys_and_keys_and_values_and_iter(self):
         d = CaseInsensitiveDict.fromkeys(string.ascii_lowercase + string.ascii_uppercase, '1')
         assert ''.join(d.keys()) == string.ascii_lowercase
+        assert 'A' in d.keys()
         assert ''.join(d) == string.ascii_lowercase
         assert ''.join(d.values()) == '1' * len(d)
 
@@ -1,7 +1,8 @@
+import array
 import enum
+import json
 import os
-import tempfile
-from functools import partial
+from unittest import mock
 
 import pytest
 
@@ -15,16 +16,18 @@ from util import (
 )
 
 
+@pytest.fixture(scope='module')
+def csv_dir(tmp_path_factory) -> str:
+    return str(tmp_path_factory.mktemp('csv'))
+
+
 class TestCSV:
 
     header = ['name', 'sex']
     rows = [['father', 'male'], ['mother', 'female']]
+    dict_rows = [{'name': 'father', 'sex': 'male'}, {'name': 'mother', 'sex': 'female'}]
     content = 'name,sex\nfather,male\nmother,female\n'
 
-    @property
-    def dict_rows(self):
-        return [dict(zip(self.header, row)) for row in self.rows]
-
     @pytest.fixture
     def types_group(self) -> tuple:
         return (
@@ -32,27 +35,33 @@ class TestCSV:
             [self.dict_rows, True],
         )
 
-    def test_write_with_path(self, types_group):
-        with tempfile.TemporaryDirectory() as dirname:
-            filepath = os.path.join(dirname, 'data.csv')
-            for rows, with_dict in types_group:
-                CSV.write(self.header, rows, with_dict=with_dict, filepath=filepath)
+    def test_write_with_path(self, types_group, csv_dir):
+        filepath = os.path.join(csv_dir, 'write.csv')
+        for rows, with_dict in types_group:
+            CSV.write(self.header, rows, with_dict=with_dict, filepath=filepath)
 
-                with open(filepath) as f:
-                    assert f.read() == self.content
+            with open(filepath) as f:
+                assert f.read() == self.content
 
     def test_write_without_path(self, types_group):
         for rows, with_dict in types_group:
             file = CSV.write(self.header, rows, with_dict=with_dict)
             assert file.getvalue().replace('\r\n', '\n') == self.content
 
-    def test_read_with_path(self):
-        with tempfile.TemporaryDirectory() as dirpath:
-            filepath = os.path.join(dirpath, 'data.csv')
-            CSV.write(self.header, self.rows, filepath=filepath)
+    def test_read_with_path(self, csv_dir):
+        filepath = os.path.join(csv_dir, 'read.csv')
+        CSV.write(self.header, self.rows, filepath=filepath)
+
+        assert CSV.read(filepath) == (self.header, self.rows)
+        assert CSV.read(filepath, with_dict=True) == (self.header, self.dict_rows)
+
+    def test_write_with_dict_missing_or_extra_key(self):
+        # 缺少的 key 写入空字符串, 多余的 key 抛出异常.
+        file = CSV.write(['a', 'b'], [{'a': 1}], with_dict=True)
+        assert file.getvalue().replace('\r\n', '\n') == 'a,b\n1,\n'
 
-            assert CSV.read(filepath) == (self.header, self.rows)
-            assert CSV.read(filepath, with_dict=True) == (self.header, self.dict_rows)
+        with pytest.raises(ValueError):
+            CSV.write(['a', 'b'], [{'a': 1, 'b': 2, 'c': 3}], with_dict=True)
 
     def test_read_without_path(self):
         f = CSV.write(self.header, self.rows)
@@ -66,11 +75,12 @@ class TestBase64:
 
     @pytest.mark.parametrize('func', (Base64.b64encode, Base64.urlsafe_b64encode))
     def test_strip_equal(self, func):
-        encode1 = partial(func, with_equal=True)
-        encode2 = partial(func, with_equal=False)
-        assert encode1(b'a') == encode2(b'a')[:-2]
-        assert encode1(b'aa') == encode2(b'aa')[:-1]
-        assert encode1(b'aaa') == encode2(b'aaa')
+        assert func(b'a', with_equal=True) == func(b'a', with_equal=False)[:-2]
+        assert func(b'aa', with_equal=True) == func(b'aa', with_equal=False)[:-1]
+        assert func(b'aaa', with_equal=True) == func(b'aaa', with_equal=False)
+        # 非 bytes 的 bytes-like 对象按字节数计算等号.
+        a = array.array('H', [1, 2])
+        assert func(a, with_equal=True) == func(bytes(a), with_equal=True)
 
     @pytest.mark.parametrize('with_equal', (True, False))
     @pytest.mark.parametrize('funcs', (
@@ -78,11 +88,10 @@ class TestBase64:
         [Base64.urlsafe_b64encode, Base64.urlsafe_b64decode],
     ))
     def test_encode_and_decode(self, with_equal, funcs):
-        encode = partial(funcs[0], with_equal=with_equal)
-        decode = partial(funcs[1], with_equal=with_equal)
-        assert decode(encode(b'a')) == b'a'
-        assert decode(encode(b'aa')) == b'aa'
-        assert decode(encode(b'aaa')) == b'aaa'
+        encode, decode = funcs
+        assert decode(encode(b'a', with_equal), with_equal) == b'a'
+        assert decode(encode(b'aa', with_equal), with_equal) == b'aa'
+        assert decode(encode(b'aaa', with_equal), with_equal) == b'aaa'
 
 
 class TestBinary:
@@ -113,6 +122,9 @@ class TestBinary:
         assert Binary.str_xor('0011', '0101') == '0110'
 
     def test_bytes_xor(self):
+        with pytest.raises(ValueError):
+            Binary.bytes_xor(b'\x03', b'\x05\x06')
+
         assert Binary.bytes_xor(b'\x03', b'\x05') == b'\x06'
 
     def test_str_2_bytes(self):
@@ -352,6 +364,11 @@ class TestAccessors:
         with pytest.raises(AttributeError):
             contract2.is_draft
 
+    def test_accessor_function_attrs(self):
+        fget = self.Contract.is_draft.fget
+        assert fget.__name__ == 'is_draft'
+        assert fget.__module__ == self.Contract.__module__
+
     def test_repeated_property(self):
         with pytest.raises(ValueError):
             @accessors(enum_cls=self.Status, cls_func_name='_is_status')
@@ -441,7 +458,7 @@ class TestFillSeq:
     @pytest.mark.parametrize(('item', 'filler'), (
         ('1', '='),
         (b'1', b'='),
-    ))
+    ), ids=('str', 'bytes'))
     def test_text_type_not_empty(self, item, filler):
         for i in range(1, 5):
             seq = item * i
@@ -463,6 +480,11 @@ def test_import_object():
     obj = import_object('util.import_object')
     assert obj == import_object
 
+    # 获取过的属性被替换后, 再次获取得到的是替换后的对象.
+    assert import_object('json.dumps') is json.dumps
+    with mock.patch('json.dumps') as dumps:
+        assert import_object('json.dumps') is dumps
+
     with pytest.raises(ImportError):
         # ValueError
         import_object('util')
@@ -505,6 +527,12 @@ def test_round_half_up():
     assert round_half_up(10500, -3) == 11000
     assert round(10500, -3) == 10000
     assert round_half_up(10501, -3) == 11000
+    assert round_half_up(-10500, -3) == -11000
+    assert round_half_up(50) == 50
+    assert round_half_up(2.5) == 3
+    assert round_half_up(-2.5) == -3
+    # 超出 `Decimal` 默认精度 (28 位) 的浮点数
+    assert round_half_up(1e30, 0) == int(1e30)
 
     # 0.155 是无限小数, 0.154999...
     # 因此无论是奇进偶舍还是四舍五入都应该变为 0.16
@@ -32,19 +32,45 @@ class CaseInsensitiveDict(UserDict):
       - `__setitem__`
       - `__delitem__`
       - `__contains__`
+
+    此外 `get`, `fromkeys`, `values` 也被 override, 它们是直接访问 `self.data` 的快捷方式,
+    绕过 `UserDict` / `Mapping` 中基于上面四个方法的通用实现.
+    (唯一的区别是 `get` 对非 str 的 key 返回 `default`, 而不是抛出 `AttributeError`.)
+
+    key 以小写的形式存在 `self.data` 中, 每次操作只调用一次 `lower` 并直接访问 `self.data`,
+    避免 `UserDict` 中先判断 `in` 再取值的两次查找.
     """
 
     def __getitem__(self, key):
-        return super().__getitem__(key.lower())
+        return self.data[key.lower()]
 
     def __setitem__(self, key, value):
-        super().__setitem__(key.lower(), value)
+        self.data[key.lower()] = value
 
     def __delitem__(self, key):
-        super().__delitem__(key.lower())
+        del self.data[key.lower()]
 
     def __contains__(self, key):
-        return isinstance(key, str) and super().__contains__(key.lower())
+        return isinstance(key, str) and key.lower() in self.data
+
+    def get(self, key, default=None):
+        # `UserDict.get` 即 `Mapping.get`: `try: self[key] except KeyError`.
+        # 这里 key 不存在时不再抛出并捕获 `KeyError`, 非 str 的 key 返回 `default` 而不是抛出 `AttributeError`.
+        if not isinstance(key, str):
+            return default
+        return self.data.get(key.lower(), default)
+
+    @classmethod
+    def fromkeys(cls, iterable, value=None):
+        # 用字典推导式一次构造底层字典, 代替 `UserDict.fromkeys` 中逐个调用 `__setitem__`.
+        d = cls()
+        d.data = {key.lower(): value for key in iterable}
+        return d
+
+    # `values` 直接返回底层字典的视图, 在 C 层迭代.
+    # `keys` 和 `items` 保留 `Mapping` 的实现, 视图的 `in` 判断会经过上面的方法, 因此同样无视大小写.
+    def values(self):
+        return self.data.values()
 
 
 class DictSerializer:
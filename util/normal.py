@@ -19,22 +19,33 @@ import json
 import operator
 import re
 import struct
+import sys
 from collections import defaultdict
 from decimal import ROUND_HALF_UP, Decimal
-from functools import reduce, partial, total_ordering
+from functools import reduce, total_ordering
 from itertools import chain
 from typing import (
     Any, Iterable, List, Optional, Sequence,
     Set, Tuple, Union,
 )
 
-from more_itertools import sliced
 
 BuiltinSeq = Union[bytes, list, str, tuple]
 BuiltinNum = Union[int, float]
 
 no_value = object()
 
+# `round_half_up` 修约到小数位时使用的精度, 下标为保留的小数位数, 例如 `_ROUND_POSITIONS[2] == Decimal('0.01')`.
+_ROUND_POSITIONS = tuple(Decimal(10) ** -i for i in range(18))
+# `CSV` 读写文件时的缓冲区大小.
+_CSV_BUFFER_SIZE = 1 << 20
+# `strip_control` 中 `str.translate` 使用的映射表, 映射到 `None` 表示删除该字符.
+_CONTROL_CHARS = dict.fromkeys(chain(range(32), range(127, 128)))
+# 10 的幂, 下标为指数.
+_POW10 = tuple(10 ** i for i in range(19))
+# `camel2snake` 中的单词: 大写字母开头, 后面跟小写字母或下划线.
+_CAMEL_WORD_RE = re.compile(r'[A-Z][_a-z]*')
+
 
 class CSV:
 
@@ -50,7 +61,11 @@ class CSV:
         `with_dict`: 返回的每行数据是 dict 还是 list 类型? 默认为 list.
         """
         # 官网中要求用 `newline=''` 的方式打开文件.
-        file = open(filepath, newline='') if isinstance(filepath, str) else filepath
+        # 读取文件时使用更大的缓冲区, 减少大文件时系统调用 read 的次数.
+        if isinstance(filepath, str):
+            file = open(filepath, newline='', buffering=_CSV_BUFFER_SIZE)
+        else:
+            file = filepath
 
         if with_dict:
             f_csv = csv.DictReader(file)
@@ -78,7 +93,11 @@ class CSV:
         `with_dict`: `rows` 中的数据是 dict 还是 list 类型? 默认为 list.
         """
         # 官网中要求用 `newline=''` 的方式打开文件.
-        file = open(filepath, 'w', newline='') if filepath is not None else io.StringIO()
+        # 写入文件时使用更大的缓冲区, 减少大量数据时系统调用 write 的次数.
+        if filepath is not None:
+            file = open(filepath, 'w', newline='', buffering=_CSV_BUFFER_SIZE)
+        else:
+            file = io.StringIO()
 
         if with_dict:
             f_csv = csv.DictWriter(file, header)
@@ -104,7 +123,9 @@ class Base64:
     def b64encode(s: bytes, with_equal: bool = False) -> bytes:
         content = base64.b64encode(s)
         if with_equal:
-            content = content.rstrip(b'=')
+            # 等号的个数由原始数据的字节数决定, 直接切片即可.
+            # 用 `memoryview` 计算字节数, 因为 `len` 对 `array.array` 等对象返回的是元素个数.
+            content = content[:len(content) - (-memoryview(s).nbytes % 3)]
         return content
 
     @staticmethod
@@ -117,7 +138,9 @@ class Base64:
     def urlsafe_b64encode(s: bytes, with_equal: bool = False) -> bytes:
         content = base64.urlsafe_b64encode(s)
         if with_equal:
-            content = content.rstrip(b'=')
+            # 等号的个数由原始数据的字节数决定, 直接切片即可.
+            # 用 `memoryview` 计算字节数, 因为 `len` 对 `array.array` 等对象返回的是元素个数.
+            content = content[:len(content) - (-memoryview(s).nbytes % 3)]
         return content
 
     @staticmethod
@@ -129,33 +152,35 @@ class Base64:
 
 class Binary:
 
-    xor_map = {
-        ('0', '0'): '0',
-        ('0', '1'): '1',
-        ('1', '0'): '1',
-        ('1', '1'): '0',
-    }
-
     @classmethod
     def str_xor(cls, s1: str, s2: str) -> str:
         """XOR 两个 8 位二进制字符串."""
         if len(s1) != len(s2):
             raise ValueError
+        # 出现 '0' 和 '1' 以外的字符时, 与之前逐位查表的实现一样抛出 `KeyError`.
+        if (s1 + s2).strip('01'):
+            raise KeyError
 
-        return ''.join(cls.xor_map[item] for item in zip(s1, s2))
+        return format(int(s1, 2) ^ int(s2, 2), f'0{len(s1)}b') if s1 else ''
 
     @classmethod
     def bytes_xor(cls, b1: bytes, b2: bytes) -> bytes:
         """XOR 两个字节序列."""
-        return bytes(item1 ^ item2 for item1, item2 in zip(b1, b2))
+        if len(b1) != len(b2):
+            raise ValueError
+
+        # 整个序列当作一个大整数做一次 XOR, 不必逐字节计算.
+        n = int.from_bytes(b1, 'big') ^ int.from_bytes(b2, 'big')
+        return n.to_bytes(len(b1), 'big')
 
     @classmethod
     def str_2_bytes(cls, s: str) -> bytes:
         """将 8 位二进制字符串转为字节序列."""
-        if len(s) % 8 != 0:
+        # `int(s, 2)` 会接受空白, 下划线和正负号, 因此先确认只有 '0' 和 '1'.
+        if len(s) % 8 != 0 or s.strip('01'):
             raise ValueError
 
-        return bytes(cls.str_2_int(item) for item in sliced(s, 8))
+        return int(s, 2).to_bytes(len(s) // 8, 'big') if s else b''
 
     @classmethod
     def hexstr_2_bytes(cls, s: str) -> bytes:
@@ -169,12 +194,12 @@ class Binary:
     @classmethod
     def bytes_2_str(cls, b: bytes) -> str:
         """将字节序列转为 8 位二进制字符串."""
-        return ''.join(cls.int_2_str(byte) for byte in b)
+        return format(int.from_bytes(b, 'big'), f'0{len(b) * 8}b') if b else ''
 
     @classmethod
     def bytes_2_hexstr(cls, b: bytes) -> str:
         """将字节序列转为 2 位十六进制字符串."""
-        return binascii.b2a_hex(b).decode()
+        return b.hex()
 
     @staticmethod
     def bytes_2_int(b: bytes) -> int:
@@ -292,6 +317,8 @@ class BitField:
     ```
     """
 
+    __slots__ = ('ids',)
+
     def __init__(self, ids: int):
         self.ids = ids
 
@@ -462,7 +489,10 @@ class PrioQueue:
                    asc: bool = True) -> 'PrioQueue':
         q = cls(asc)
         for priority, item in pairs:
-            q.push(priority, item)
+            q._index += 1
+            q._heap.append(q._make_item(priority, item))
+        # 一次性建堆是 O(n), 逐个 `push` 是 O(n log n).
+        heapq.heapify(q._heap)
         return q
 
 
@@ -525,16 +555,26 @@ def accessors(enum_cls: enum.Enum, cls_func_name: str,
     """
     def deco(cls: type):
         func = getattr(cls, cls_func_name)
-        # 由于 `func` 是一个 method, 所以获取函数的第二个参数名用于下面的 `partial`, 避开 `self` 参数.
+        # 由于 `func` 是一个 method, 所以获取函数的第二个参数名用于下面生成的函数, 避开 `self` 参数.
         param_name = list(inspect.signature(func).parameters.keys())[1]
+        # 生成的函数直接以关键字参数调用 `func`, 省去 `partial` 每次调用时合并参数的开销.
+        code = compile(
+            f'def accessor(self):\n'
+            f'    return func(self, {param_name}=value)\n',
+            '<accessors>', 'exec',
+        )
 
         for name, value in enum_cls.__members__.items():
             property_name = cls_property_prefix + name.lower()
             if property_name in cls.__dict__:
                 raise ValueError
-            property_method = property(partial(func, **{param_name: value}))
-            # 注意这里不能使用 `partialmethod`, 它不是 `callable`.
-            setattr(cls, property_name, property_method)
+            # `__name__` 决定生成的函数的 `__module__`.
+            namespace = {'__name__': cls.__module__, 'func': func, 'value': value}
+            exec(code, namespace)
+            accessor = namespace['accessor']
+            accessor.__name__ = property_name
+            accessor.__qualname__ = f'{cls.__qualname__}.{property_name}'
+            setattr(cls, property_name, property(accessor))
 
         return cls
     return deco
@@ -552,15 +592,18 @@ def camel2snake(s: str) -> str:
     if not s[0].isupper():
         raise ValueError
 
-    items = re.findall(r'[A-Z][_a-z]*', s)
-    return '_'.join(item for item in items).lower()
+    return '_'.join(_CAMEL_WORD_RE.findall(s)).lower()
 
 
 def chinese_num(num: int) -> str:
-    """将数字转成中文."""
-    if num >= 100 or num < 0:
-        return ''
+    """将数字转成中文.
+
+    只支持 [0, 100) 之间的整数, 其他数字返回空字符串.
+    """
+    return _CHINESE_NUMS.get(num, '')
+
 
+def _chinese_num(num: int) -> str:
     single = dict(zip(
         range(1, 11),
         '一二三四五六七八九十',
@@ -577,50 +620,56 @@ def chinese_num(num: int) -> str:
         return single[num // 10] + single[10] + single[num % 10]
 
 
+# 结果只有 100 个, 导入时全部算好, 调用时只需查表.
+_CHINESE_NUMS = {num: _chinese_num(num) for num in range(100)}
+
+
 def fill_seq(seq: BuiltinSeq, size: int, filler: Any) -> BuiltinSeq:
     """用 `filler` 填充序列使其能被 `size` 整除."""
     if isinstance(seq, (str, bytes)) and len(filler) != 1:
         raise ValueError
 
-    if len(seq) % size == 0:
-        return seq
-
-    num = size - (len(seq) % size)
+    # 需要填充的个数, 当 `len(seq)` 能被 `size` 整除时为 0.
+    num = -len(seq) % size
     if isinstance(seq, (str, bytes)):
-        return seq + filler * num
+        return seq.ljust(len(seq) + num, filler)
     else:  # list or tuple
-        return seq + type(seq)(filler for _ in range(num))
+        # 先构造只有一个元素的同类型序列, 再用 `*` 重复, 避免逐个元素迭代生成.
+        return seq + type(seq)((filler,)) * num
 
 
 def format_rows(data: List[dict]) -> str:
     """用更可读的形式展示数据."""
-    # 计算每列的最大长度.
-    lens = defaultdict(int)
-    for row in data:
-        for k, v in row.items():
-            lens[k] = max(len(str(v)), lens[k])
-    lens = {k: max(len(k), v) for k, v in lens.items()}
+    # 每个值只转一次字符串.
+    rows = [[(k, str(v)) for k, v in row.items()] for row in data]
+
+    # 计算每列的最大长度 (至少为列名的长度).
+    lens = {}
+    for row in rows:
+        for k, v in row:
+            lens[k] = max(len(v), lens.get(k, len(k)))
 
     # header
     res = [
-        '  '.join('{:<{}}'.format(k, v) for k, v in lens.items()),
-        '  '.join('{:<{}}'.format('-' * v, v) for v in lens.values()),
+        '  '.join(k.ljust(n) for k, n in lens.items()),
+        '  '.join('-' * n for n in lens.values()),
     ]
 
     # data
-    for row in data:
-        s = '  '.join('{:<{}}'.format(str(v), lens[k]) for k, v in row.items())
-        res.append(s)
+    res.extend('  '.join(v.ljust(lens[k]) for k, v in row) for row in rows)
     return '\n'.join(res)
 
 
 def import_object(object_path: str) -> Any:
-    """根据路径获取对象."""
+    """根据路径获取对象.
+
+    每次调用都重新获取属性, 因此能拿到被 mock, reload 等替换后的对象.
+    """
     try:
-        dot = object_path.rindex('.')
-        module, obj = object_path[:dot], object_path[dot + 1:]
-        return getattr(importlib.import_module(module), obj)
-    # rindex        -> ValueError
+        module, _, obj = object_path.rpartition('.')
+        # 已导入的模块直接从 `sys.modules` 中取, 省去 `import_module` 的查找开销.
+        return getattr(sys.modules.get(module) or importlib.import_module(module), obj)
+    # import_module -> ValueError (路径中没有 '.' 时, 模块名为空)
     # import_module -> ModuleNotFoundError
     # getattr       -> AttributeError
     except (ValueError, ModuleNotFoundError, AttributeError):
@@ -668,25 +717,45 @@ def round_half_up(number: BuiltinNum, ndigits: int = 0) -> BuiltinNum:
                > 0 为修约到小数位, <= 0 为修约到整数位.
 
     此外:
-      大多数真实场景中不需要支持 `ndigits <= 0` 的情况, 因此只需要复制最后三行即可.
+      大多数真实场景中不需要支持 `ndigits <= 0` 的情况, 因此只需要复制 `ndigits > 0` 的部分即可.
     """
-    def _get_number(_ndigits: int) -> int:
-        return int(str(number)[_ndigits - 1])
-
     if ndigits <= 0:
-        half_even_result = int(round(number, ndigits))
-
-        # 如果保留位是偶数 & 保留位后一位是 5 & 5 后面全是 0, 那么就入
-        if all((
-            _get_number(ndigits) & 1 == 0,
-            _get_number(ndigits + 1) == 5,
-            number % (10 ** abs(ndigits + 1)) == 0
-        )):
-            return half_even_result + 10 ** abs(ndigits)
-        return half_even_result
+        exponent = -ndigits
+        power = _POW10[exponent] if exponent < len(_POW10) else 10 ** exponent
+        # 整数值的浮点数 (包括超出 `Decimal` 默认精度的大数, 例如 1e30) 按整数处理.
+        if isinstance(number, float) and number.is_integer():
+            number = int(number)
+        if isinstance(number, int):
+            # 对绝对值加上一半后向下取整, 再还原符号, 即向远离 0 的方向入.
+            result = (abs(number) + power // 2) // power * power
+            return result if number >= 0 else -result
+        # 浮点数先缩小到修约位为个位, 再用 `Decimal` 修约.
+        scaled = Decimal(str(number)).scaleb(ndigits)
+        return int(scaled.quantize(_ROUND_POSITIONS[0], rounding=ROUND_HALF_UP)) * power
+
+    if isinstance(number, int):
+        return float(number)
+
+    # 按最短的十进制表示 (即 `repr`) 修约, 因此 0.155 会被当做 0.155, 而不是 0.15499....
+    # 直接对数字字符串做整数运算, 不需要构造 `Decimal`.
+    text = repr(abs(float(number)))
+    int_part, dot, frac_part = text.partition('.')
+    # 科学计数法, inf, nan 较少见, 仍交给 `Decimal` 处理.
+    if dot and 'e' not in text:
+        if len(frac_part) <= ndigits:
+            return float(number)
+        # 保留位后一位 >= 5 就入.
+        scaled = int(int_part + frac_part[:ndigits]) + (frac_part[ndigits] >= '5')
+        power = _POW10[ndigits] if ndigits < len(_POW10) else 10 ** ndigits
+        # 整数相除的结果是与精确值最接近的浮点数, 与 `float(Decimal(...))` 一致.
+        result = scaled / power
+        return result if number >= 0 else -result
 
     decimal = Decimal(str(number))
-    position = Decimal('0.{}1'.format('0' * (abs(ndigits) - 1)))
+    if ndigits < len(_ROUND_POSITIONS):
+        position = _ROUND_POSITIONS[ndigits]
+    else:
+        position = Decimal(10) ** -ndigits
     return float(decimal.quantize(position, rounding=ROUND_HALF_UP))
 
 
@@ -696,5 +765,4 @@ def strip_control(s: str) -> str:
     可以通过以下代码知道哪些字符串是控制字符
     `unicodedata.category(char) == 'Cc'`
     """
-    controls = {chr(i) for i in chain(range(32), range(127, 128))}
-    return ''.join(c for c in s if c not in controls)
+    return s.translate(_CONTROL_CHARS)
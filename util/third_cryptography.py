@@ -33,6 +33,8 @@ rsa_padding = asy_padding.OAEP(
     label=None,
 )
 aes_padding = padding.PKCS7(algorithms.AES.block_size)
+# PKCS7 填充表, 下标 n 对应 n 个值为 n 的字节.
+aes_pads = tuple(bytes((n,)) * n for n in range(AES_BLOCK_SIZE + 1))
 
 
 class AES:
@@ -50,8 +52,9 @@ class AES:
     def encrypt(self, msg: bytes) -> bytes:
         """加密."""
         encryptor = self.cipher.encryptor()
-        padder = aes_padding.padder()
-        msg = padder.update(msg) + padder.finalize()
+        # PKCS7: 填充 n 个值为 n 的字节, n 为补齐到块大小需要的字节数. (刚好整块时填充一整块)
+        # 不使用 `+=`, 传入 `bytearray` 时不修改调用方的数据.
+        msg = msg + aes_pads[AES_BLOCK_SIZE - len(msg) % AES_BLOCK_SIZE]
         return encryptor.update(msg) + encryptor.finalize()
 
     def decrypt(self, msg: bytes) -> bytes:
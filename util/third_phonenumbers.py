@@ -2,16 +2,28 @@ __all__ = (
     'parse_phone',
 )
 
+import re
 from typing import Optional
 
 import phonenumbers
 
+# 只有 11 位数字或带 +86 前缀的 11 位数字的中国手机号.
+cn_mobile_re = re.compile(r'(?:\+86)?(1[0-9]{10})')
+
 
 def parse_phone(source: str) -> Optional[str]:
     """解析中国地区的手机号.
 
     将带 +86 前缀的手机号和正常的 11 位手机号都转换成 11 位手机号.
+
+    最常见的两种格式直接用正则提取号码, 跳过 `phonenumbers.parse` 的通用解析, 只做有效性校验.
+    其他格式 (例如带空格或横线) 仍交给 `phonenumbers.parse` 处理.
     """
+    m = cn_mobile_re.fullmatch(source)
+    if m is not None:
+        pp = phonenumbers.PhoneNumber(country_code=86, national_number=int(m.group(1)))
+        return m.group(1) if phonenumbers.is_valid_number(pp) else None
+
     try:
         pp = phonenumbers.parse(source, 'CN')
     except phonenumbers.NumberParseException: